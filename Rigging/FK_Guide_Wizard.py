@@ -0,0 +1,524 @@
+'''
+This is a step-by-step wizard for placing FK joint guides and building the joints from them.
+
+It is expected that the following naming conventions are kept:
+
+Joints = L_Clavicle_FK_Jnt
+Guides = L_Clavicle_FK_Guide
+
+The wizard walks you through every joint in the spec one step at a time.
+For each step you can create a locator guide, snap it to your current selection,
+and once all the left-side guides are placed you can mirror them to the right,
+build the FK joints at the guide positions and orient the chains.
+
+Spine and neck counts plus finger count/segments are adjustable with the sliders;
+hit "Rebuild Steps" after changing them.
+'''
+
+import functools
+from contextlib import contextmanager
+
+import maya.cmds as cmds
+import maya.utils
+from maya.api import OpenMaya as om
+
+try:
+    from PySide6 import QtCore  # Maya 2025+
+except ImportError:
+    from PySide2 import QtCore
+
+try:
+    import numpy as np  # ships with recent Maya
+except ImportError:
+    np = None
+
+if np is not None:
+    _M_FLIP = np.diag([-1.0, 1.0, 1.0, 1.0])
+
+
+def mirror_matrices(mats):
+    # Reflect a batch of flat 4x4 world matrices across the YZ plane.
+    # With numpy the whole stack is conjugated in one F @ M @ F pass;
+    # without it, fall back to negating the same entries per matrix
+    # (row/column 0 of the rotation block plus the X translation).
+    if np is not None:
+        stacked = np.asarray(mats, dtype=float).reshape(-1, 4, 4)
+        return (_M_FLIP @ stacked @ _M_FLIP).reshape(-1, 16).tolist()
+    out = []
+    for mat in mats:
+        mat = list(mat)
+        mat[12] = -mat[12]
+        mat[1] = -mat[1]
+        mat[2] = -mat[2]
+        mat[4] = -mat[4]
+        mat[8] = -mat[8]
+        out.append(mat)
+    return out
+
+
+@contextmanager
+def suspend_scene_updates():
+    # Defer DG dirty propagation, viewport redraws and per-command undo
+    # records while a batch of scene edits runs; everything lands as one
+    # undo chunk when the block closes.
+    prev_eval = cmds.evaluationManager(query=True, mode=True)[0]
+    cmds.evaluationManager(mode='off')
+    cmds.refresh(suspend=True)
+    cmds.undoInfo(openChunk=True)
+    try:
+        yield
+    finally:
+        cmds.undoInfo(closeChunk=True)
+        cmds.refresh(suspend=False)
+        cmds.evaluationManager(mode=prev_eval)
+
+
+@functools.lru_cache(maxsize=64)
+def _base_spec_cached(spine_count, neck_count):
+    # Build the ordered joint spec for the core body. Parents always come
+    # before their children so the build pass can parent in one sweep.
+    # Cached per count pair (the sliders only cover a few dozen combos);
+    # frozen to tuples so cache entries can't be mutated by callers.
+    spec = []
+
+    parent = None
+    for i in range(1, spine_count + 1):
+        name = f"Spine_{i:02d}_FK_Jnt"
+        spec.append({"key": f"Spine_{i}", "name": name, "parent": parent, "side": "C", "required": True})
+        parent = name
+    chest = parent
+
+    for i in range(1, neck_count + 1):
+        name = f"Neck_{i:02d}_FK_Jnt"
+        spec.append({"key": f"Neck_{i}", "name": name, "parent": parent, "side": "C", "required": True})
+        parent = name
+    spec.append({"key": "Head", "name": "Head_FK_Jnt", "parent": parent, "side": "C", "required": True})
+
+    # Left arm hangs off the top spine joint
+    parent = chest
+    for part in ["Clavicle", "Shoulder", "Elbow", "Wrist", "Hand"]:
+        name = f"L_{part}_FK_Jnt"
+        spec.append({"key": f"L_{part}", "name": name, "parent": parent, "side": "L", "required": True})
+        parent = name
+
+    # Left leg hangs off the bottom spine joint
+    parent = "Spine_01_FK_Jnt"
+    for part in ["UpperLeg", "LowerLeg", "Ankle", "Ball", "Toe"]:
+        name = f"L_{part}_FK_Jnt"
+        spec.append({"key": f"L_{part}", "name": name, "parent": parent, "side": "L", "required": True})
+        parent = name
+
+    return tuple(tuple(row.items()) for row in spec)
+
+
+def build_base_spec(spine_count, neck_count):
+    # Hand out cheap mutable copies of the cached rows
+    return [dict(row) for row in _base_spec_cached(spine_count, neck_count)]
+
+
+@functools.lru_cache(maxsize=64)
+def _finger_rows_cached(finger_count, segments):
+    # Fingers are chains hanging off the left hand. Build the rows as one
+    # flat table; cached per (count, segments) like the base spec.
+    rows = []
+    for f in range(1, finger_count + 1):
+        parent = "L_Hand_FK_Jnt"
+        names = [f"L_Finger_{f:02d}_{s:02d}_FK_Jnt" for s in range(1, segments + 1)]
+        for s, name in enumerate(names, 1):
+            rows.append({"key": f"L_F{f}_{s}", "name": name, "parent": parent, "side": "L", "required": True})
+            parent = name
+    return tuple(tuple(row.items()) for row in rows)
+
+
+def append_fingers(spec, finger_count, segments):
+    spec.extend(dict(row) for row in _finger_rows_cached(finger_count, segments))
+
+
+# Side-prefix swap table; one dict lookup instead of chained startswith
+_SWAP = {"L": "R", "R": "L"}
+
+
+def swap_LR(name):
+    if name and len(name) > 1 and name[1] == "_" and name[0] in _SWAP:
+        return _SWAP[name[0]] + name[1:]
+    return name
+
+
+# Roots of the joint chains that get oriented after building
+FK_CHAIN_ROOTS = [
+    "Spine_01_FK_Jnt",
+    "Neck_01_FK_Jnt",
+    "Head_FK_Jnt",
+    "L_Clavicle_FK_Jnt",
+    "R_Clavicle_FK_Jnt",
+    "L_UpperLeg_FK_Jnt",
+    "R_UpperLeg_FK_Jnt",
+    "L_Hand_FK_Jnt",
+    "R_Hand_FK_Jnt",
+]
+
+
+class SelectionQueryWorker(QtCore.QObject):
+    # Runs selection queries for the wizard off the Qt main thread.
+    # cmds is strictly main-thread, so the worker schedules the actual ls
+    # through executeInMainThreadWithResult; what moves off the main
+    # thread is the request handling and the wait, which keeps the
+    # dialog's event loop interactive while large selections are walked.
+
+    resultReady = QtCore.Signal(list)
+
+    @QtCore.Slot()
+    def query(self):
+        sel = maya.utils.executeInMainThreadWithResult(
+            lambda: cmds.ls(sl=True, type="transform")) or []
+        self.resultReady.emit(list(sel))
+
+
+class FKGuideWizard:
+    def __init__(self):
+        # Define unique window ID
+        window_id = "fkGuideWizardWin"
+
+        # Check if the window exists, if so delete it
+        if cmds.window(window_id, exists=True):
+            cmds.deleteUI(window_id)
+
+        self.guides_grp = "FK_Guides_Grp"
+        self.step_index = 0
+        # In-memory view of which guides exist, so UI refreshes don't hit
+        # the DG with a name lookup per step. Rebuilt after any mutation.
+        self._guide_set = set()
+        self._refresh_guide_cache()
+
+        # Create the window
+        self.window = cmds.window(window_id, title="FK Guide Wizard", widthHeight=(420, 320))
+        cmds.columnLayout(adjustableColumn=True, rowSpacing=6)
+
+        self.spine_field = cmds.intSliderGrp(label="Spine Joints", field=True, min=1, max=8, value=3)
+        self.neck_field = cmds.intSliderGrp(label="Neck Joints", field=True, min=1, max=6, value=1)
+        self.finger_field = cmds.intSliderGrp(label="Fingers", field=True, min=0, max=5, value=5)
+        self.segment_field = cmds.intSliderGrp(label="Finger Segments", field=True, min=1, max=4, value=3)
+        cmds.button(label="Rebuild Steps", command=self.rebuild_spec)
+        cmds.separator(h=10)
+
+        self.step_label = cmds.text(label="")
+
+        cmds.rowLayout(numberOfColumns=2, columnWidth2=(200, 200), adjustableColumn=2)
+        cmds.button(label="< Prev Step", command=self.prev_step)
+        cmds.button(label="Next Step >", command=self.next_step)
+        cmds.setParent('..')
+
+        cmds.button(label="Create / Select Guide", command=self.create_or_select_current_guide)
+        cmds.button(label="Snap Guide To Selection", command=self.snap_current_guide)
+        cmds.button(label="Create All Remaining Guides", command=self.create_all_remaining_guides)
+        cmds.separator(h=10)
+
+        cmds.button(label="Mirror L -> R Guides", command=self.mirror_left_to_right_guides)
+        cmds.button(label="Build FK Joints", command=self.build_fk_joints)
+        cmds.button(label="Orient Joints", command=self.orient_all_fk)
+        cmds.button(label="Clear Guides", command=self.clear_all_guides)
+
+        self.rebuild_spec()
+
+        # Selection queries go through a worker thread; requests are
+        # queued over to it and results come back via its signal, so the
+        # dialog never blocks on a big selection walk
+        self._pending_snap = None
+        self._sel_thread = QtCore.QThread()
+        self._sel_worker = SelectionQueryWorker()
+        self._sel_worker.moveToThread(self._sel_thread)
+        self._sel_worker.resultReady.connect(self._on_selection_result)
+        self._sel_thread.start()
+        cmds.scriptJob(uiDeleted=[window_id, self._stop_worker])
+
+        # Show the window
+        cmds.showWindow(self.window)
+
+    def _stop_worker(self):
+        self._sel_thread.quit()
+        self._sel_thread.wait()
+
+    def rebuild_spec(self, *args):
+        spine_count = cmds.intSliderGrp(self.spine_field, query=True, value=True)
+        neck_count = cmds.intSliderGrp(self.neck_field, query=True, value=True)
+        finger_count = cmds.intSliderGrp(self.finger_field, query=True, value=True)
+        segments = cmds.intSliderGrp(self.segment_field, query=True, value=True)
+
+        spec = build_base_spec(spine_count, neck_count)
+        append_fingers(spec, finger_count, segments)
+
+        self.spec = spec
+        self.steps = list(spec)
+
+        # Joint <-> guide names only change when the spec does, so map them
+        # once here instead of re-deriving them on every label refresh,
+        # mirror iteration and build iteration. Mirrored right-side names
+        # are included so the build pass can use the same table.
+        self._guide_of = {s["name"]: self.guide_name_for_joint(s["name"]) for s in spec}
+        for s in spec:
+            if s["side"] == "L":
+                self._guide_of[swap_LR(s["name"])] = swap_LR(self._guide_of[s["name"]])
+        self._joint_of = {g: j for j, g in self._guide_of.items()}
+
+        # Per-step (name, guide, parent, label prefix) tuples so the label
+        # refresh is a plain index into precomputed strings; only the
+        # placed/missing status is evaluated per render
+        total = len(self.steps)
+        self._step_cache = [
+            (s["name"], self._guide_of[s["name"]], s["parent"],
+             f"Step {i + 1}/{total}: {s['name']}")
+            for i, s in enumerate(self.steps)
+        ]
+
+        self._rebuild_placed_mask()
+
+        self.step_index = min(self.step_index, len(self.steps) - 1)
+        self.refresh_step_label()
+
+    def _refresh_guide_cache(self):
+        if cmds.objExists(self.guides_grp):
+            self._guide_set = set(cmds.listRelatives(self.guides_grp, children=True) or [])
+        else:
+            self._guide_set = set()
+        self._rebuild_placed_mask()
+
+    def _rebuild_placed_mask(self):
+        # One placed/missing byte per step, indexed by step_index, so the
+        # label refresh doesn't even need the set lookup. Individual bits
+        # are patched on single-guide mutations; bulk mutations come back
+        # through here.
+        steps = getattr(self, "_step_cache", None)
+        if steps is not None:
+            self._placed = bytearray(guide in self._guide_set for _n, guide, _p, _pre in steps)
+
+    def guide_name_for_joint(self, joint_name):
+        return joint_name.replace("_Jnt", "_Guide")
+
+    def refresh_step_label(self, *args):
+        prefix = self._step_cache[self.step_index][3]
+        status = "placed" if self._placed[self.step_index] else "missing"
+        cmds.text(self.step_label, edit=True, label=f"{prefix} ({status})")
+
+    def prev_step(self, *args):
+        self.step_index = max(0, self.step_index - 1)
+        self.refresh_step_label()
+
+    def next_step(self, *args):
+        self.step_index = min(len(self.steps) - 1, self.step_index + 1)
+        self.refresh_step_label()
+
+    def create_or_select_current_guide(self, *args):
+        step = self.steps[self.step_index]
+        guide = self._step_cache[self.step_index][1]
+
+        if guide in self._guide_set:
+            cmds.select(guide, replace=True)
+            self.refresh_step_label()
+            return
+
+        if not cmds.objExists(self.guides_grp):
+            cmds.group(empty=True, name=self.guides_grp, world=True)
+
+        guide = self._create_guide(step)
+        cmds.select(guide, replace=True)
+        # patch the caches directly; a single create needs no rescan
+        self._guide_set.add(guide)
+        self._placed[self.step_index] = 1
+        self.refresh_step_label()
+
+    def _create_guide(self, step):
+        guide = cmds.spaceLocator(name=self._guide_of[step["name"]])[0]
+        # one double3 setAttr instead of an attribute per axis
+        cmds.setAttr(guide + ".localScale", 2, 2, 2, type="double3")
+        guide = cmds.parent(guide, self.guides_grp)[0]
+
+        # Start the new guide at its parent guide so chains grow from the parent
+        parent_guide = self._guide_of[step["parent"]] if step["parent"] else None
+        if parent_guide and cmds.objExists(parent_guide):
+            pos = cmds.xform(parent_guide, query=True, worldSpace=True, translation=True)
+            cmds.xform(guide, worldSpace=True, translation=pos)
+        return guide
+
+    def create_all_remaining_guides(self, *args):
+        missing = [s for s in self.steps if self._guide_of[s["name"]] not in self._guide_set]
+        if not missing:
+            cmds.warning("All guides are already placed.")
+            return
+
+        if not cmds.objExists(self.guides_grp):
+            cmds.group(empty=True, name=self.guides_grp, world=True)
+
+        # Spec order means parents are created before their children, so
+        # each new guide can still start at its parent's position
+        with suspend_scene_updates():
+            for step in missing:
+                self._create_guide(step)
+
+        self._refresh_guide_cache()
+        self.refresh_step_label()
+
+    def snap_current_guide(self, *args):
+        guide = self._step_cache[self.step_index][1]
+
+        if guide not in self._guide_set:
+            cmds.warning(f"Guide {guide} does not exist yet, create it first.")
+            return
+
+        # hand the selection query to the worker thread; the snap itself
+        # happens in _apply_snap_selection once the result comes back
+        self._pending_snap = guide
+        QtCore.QMetaObject.invokeMethod(
+            self._sel_worker, "query", QtCore.Qt.QueuedConnection)
+
+    def _on_selection_result(self, sel):
+        # the worker's signal may deliver on its own thread; hop back to
+        # the main thread before touching the scene
+        maya.utils.executeDeferred(self._apply_snap_selection, sel)
+
+    def _apply_snap_selection(self, sel):
+        guide = self._pending_snap
+        if guide is None:
+            return
+        self._pending_snap = None
+        self.snap_to_selection(guide, sel)
+        self.refresh_step_label()
+
+    def snap_to_selection(self, node, sel=None):
+        # sel lets callers that already queried the selection skip the
+        # re-query; defaults to the active selection
+        if sel is None:
+            sel = cmds.ls(sl=True, type="transform")
+        sel = [s for s in sel if s.split("|")[-1] != node]
+        if not sel:
+            cmds.warning("Select the object to snap the guide to.")
+            return
+        pos = cmds.xform(sel[0], query=True, worldSpace=True, translation=True)
+        cmds.xform(node, worldSpace=True, translation=pos)
+
+    def mirror_left_to_right_guides(self, *args):
+        if not cmds.objExists(self.guides_grp):
+            cmds.warning("No guides to mirror.")
+            return
+
+        # One sweep over the group children instead of per-spec existence probes
+        children = cmds.listRelatives(self.guides_grp, children=True, fullPath=True) or []
+        lefts = [g for g in children if "|L_" in g]
+
+        with suspend_scene_updates():
+            self._mirror_guides(lefts)
+
+        self._refresh_guide_cache()
+        self.refresh_step_label()
+
+    def _mirror_guides(self, lefts):
+        # Bind the hot functions as locals; the loop body is light enough
+        # that the per-call attribute lookups on cmds show up.
+        getAttr = cmds.getAttr
+        xform = cmds.xform
+        guide_set = self._guide_set
+
+        # Gather every left world matrix first, reflect the whole stack in
+        # one batch, then write each result back with a single xform.
+        mats = [getAttr(g + ".worldMatrix[0]") for g in lefts]
+        for g, mat in zip(lefts, mirror_matrices(mats)):
+            dst = swap_LR(g.split("|")[-1])
+            if dst not in guide_set:
+                dst = cmds.spaceLocator(name=dst)[0]
+                dst = cmds.parent(dst, self.guides_grp)[0]
+            xform(dst, worldSpace=True, m=mat)
+
+    def _build_entries(self):
+        # Spec entries plus mirrored right-side entries for every left-side one
+        entries = list(self.spec)
+        for s in self.spec:
+            if s["side"] != "L":
+                continue
+            entries.append({
+                "key": swap_LR(s["key"]),
+                "name": swap_LR(s["name"]),
+                "parent": swap_LR(s["parent"]),
+                "side": "R",
+                "required": s["required"],
+            })
+        return entries
+
+    def build_fk_joints(self, *args):
+        # ~50 joints means hundreds of commands; keep the DG quiet until done
+        with suspend_scene_updates():
+            self._build_fk_joints()
+
+    def _build_fk_joints(self):
+        # Local bindings for the hot loop, same idea as _mirror_guides
+        objExists = cmds.objExists
+        guide_of = self._guide_of
+
+        # Collect the buildable entries and their guides into one
+        # MSelectionList; reading translations through MFnTransform skips
+        # the command parser, argument marshalling and undo record that a
+        # cmds.xform query pays on every guide.
+        created = []
+        guide_sel = om.MSelectionList()
+        for s in self._build_entries():
+            guide = guide_of[s["name"]]
+            if not objExists(guide):
+                if s["required"] and s["side"] != "R":
+                    cmds.warning(f"Missing guide: {guide}")
+                continue
+            if objExists(s["name"]):
+                continue
+            guide_sel.add(guide)
+            created.append(s)
+
+        if not created:
+            return
+
+        world_pos = {}
+        for i, s in enumerate(created):
+            world_pos[s["name"]] = om.MFnTransform(guide_sel.getDagPath(i)).translation(om.MSpace.kWorld)
+
+        # Accumulate every create + reparent in a single MDagModifier and
+        # commit them with one doIt() instead of a cmds.joint/cmds.parent
+        # command dispatch per spec entry. Spec order puts parents before
+        # children, so a joint's parent is already in new_objs by the time
+        # it is created.
+        mod = om.MDagModifier()
+        new_objs = {}
+        for s in created:
+            parent_obj = new_objs.get(s["parent"], om.MObject.kNullObj)
+            jobj = mod.createNode("joint", parent_obj)
+            mod.renameNode(jobj, s["name"])
+            new_objs[s["name"]] = jobj
+        mod.doIt()
+
+        # Freshly created joints carry no rotation or scale, so the local
+        # translation is just the world offset from the parent joint
+        for s in created:
+            pos = world_pos[s["name"]]
+            if s["parent"] in new_objs:
+                pos = pos - world_pos[s["parent"]]
+            path = om.MDagPath.getAPathTo(new_objs[s["name"]])
+            om.MFnTransform(path).setTranslation(pos, om.MSpace.kTransform)
+
+        # Hook up parents that already existed in the scene before this run
+        for s in created:
+            if s["parent"] and s["parent"] not in new_objs and objExists(s["parent"]):
+                cmds.parent(s["name"], s["parent"])
+
+    def orient_all_fk(self, *args):
+        # One ls call filters the roots that exist, one joint edit orients
+        # every chain; no per-root objExists/listRelatives round-trips.
+        existing = cmds.ls(FK_CHAIN_ROOTS)
+        if not existing:
+            cmds.warning("No FK joints to orient, build them first.")
+            return
+        with suspend_scene_updates():
+            cmds.joint(existing, edit=True, oj="xyz", sao="zup", ch=True, zso=True)
+
+    def clear_all_guides(self, *args):
+        if cmds.objExists(self.guides_grp):
+            cmds.delete(self.guides_grp)
+        self._refresh_guide_cache()
+        self.refresh_step_label()
+
+
+FKGuideWizard()
@@ -9,64 +9,65 @@ Controls = L_Arm_01_FK_Ctrl
 If your rig does not follow this naming convention then this version of the script will not work.
 
 This script will take your selected controls and do the following:
-duplicate them, re-name them,unparent the controls from their group
-match all translations of the control groups to the proper joints
-add the controls to an empty group that is created at world 0,
-scale that group along the x-axis by a value of -1 re-parent them to the correct group
-set translate x,y,z on the control to 0 and finally freezes the transformation.
+duplicate their groups, re-name the groups and controls to the R_ side,
+reflect the left joint's world matrix across the YZ plane and apply it
+to the duplicated group directly, then zero the control's translates
+and freeze the transformations.
 '''
 
 import maya.cmds as cmds
 
-def reparent_controls_to_groups(controls):
-
-    # controls = list of control transforms (strings)
-    for ctrl in controls:
-        ctrl_leaf = ctrl.split("|")[-1]  # R_Arm_Ctrl
-        if not ctrl_leaf.endswith("_Ctrl"):
-            continue
-
-        grp_name = ctrl_leaf.replace("_Ctrl", "_Ctrl_Grp")
-
-        if cmds.objExists(grp_name):
-            cmds.parent(ctrl, grp_name)
-        else:
-            cmds.warning("Missing control group: {}".format(grp_name))
-
-def MirrorControls():
-    ctrls = cmds.ls(sl=True, type="transform")
+def MirrorControls(ctrls=None):
+    # callers that already hold a selection list can pass it in and skip
+    # the active-selection walk
+    if ctrls is None:
+        ctrls = cmds.ls(sl=True, type="transform")
     if not ctrls:
         cmds.warning("please select at least one control")
         return
 
-    #Create a mirror group
-    mirror_grp = "mirror_group"
-    if not cmds.objExists(mirror_grp):
-        # create an empty Group at world origin
-        mirror_grp = cmds.group(em=True, name="mirror_group", w=True)
-
-    unparented_ctrls = []
-
-    #For loop to duplicate the controls, rename ctrls and grps
-    #unparent them from the newly renamed groups
-    #add ctrls to a mirror group
+    # Suspend DG evaluation, viewport redraws and per-command undo records
+    # while the duplicates are churned through; one undo chunk for the lot.
+    prev_eval = cmds.evaluationManager(query=True, mode=True)[0]
+    cmds.evaluationManager(mode='off')
+    cmds.refresh(suspend=True)
+    cmds.undoInfo(openChunk=True)
+    try:
+        _mirror_controls(ctrls)
+    finally:
+        cmds.undoInfo(closeChunk=True)
+        cmds.refresh(suspend=False)
+        cmds.evaluationManager(mode=prev_eval)
+
+def _mirror_controls(ctrls):
+    # bind the hot cmds functions as locals so the loop body skips the
+    # module attribute lookup on every call
+    listRelatives = cmds.listRelatives
+    duplicate = cmds.duplicate
+    rename = cmds.rename
+    objExists = cmds.objExists
+    getAttr = cmds.getAttr
+    xform = cmds.xform
+
+    mirrored_ctrls = []
+
+    #For loop to duplicate the control groups and rename ctrls and grps.
+    #The group is placed by reflecting the left joint's world matrix in
+    #Python, so no scratch mirror group, unparenting or -1 scale is needed.
     for ctrl in ctrls:
-        parent = cmds.listRelatives(ctrl, parent=True, type="transform")
+        parent = listRelatives(ctrl, parent=True, type="transform")
         if not parent:
             continue
         parent = parent[0]
 
-        # duplicate the ctrl group (returns a list)
-        dupe_grp = cmds.duplicate(parent)[0]
-
-        # rename the duplicated group
-        new_grp_name = dupe_grp.replace("L_", "R_", 1)
-        dupe_grp = cmds.rename(dupe_grp, new_grp_name)
-        grp_name_end = dupe_grp.replace("Grp1", "Grp", 1)
-        dupe_grp = cmds.rename(dupe_grp, grp_name_end)
+        # duplicate the ctrl group straight to its final R_ name; Maya only
+        # appends a digit if the name collides, so no "Grp1" cleanup rename
+        # is needed afterwards
+        new_grp_name = parent.split("|")[-1].replace("L_", "R_", 1)
+        dupe_grp = duplicate(parent, name=new_grp_name)[0]
 
         # find the control under the duplicated group (direct child transform)
-        kids = cmds.listRelatives(dupe_grp, children=True, type="transform", fullPath=True) or []
+        kids = listRelatives(dupe_grp, children=True, type="transform", fullPath=True) or []
 
         dupe_ctrl = None
         for k in kids:
@@ -78,39 +79,31 @@ def MirrorControls():
             leaf = dupe_ctrl.split("|")[-1]  # e.g. L_Arm_Ctrl
             if leaf.startswith("L_"):
                 new_leaf = leaf.replace("L_", "R_", 1)
-                dupe_ctrl = cmds.rename(dupe_ctrl, new_leaf)  # rename using FULL PATH, new name is leaf
-
-                #unparent Ctrl from Grp
-                dupe_ctrl = cmds.parent(dupe_ctrl, world=True) [0]
-
-                #store values to reparent them later
-                unparented_ctrls.append(dupe_ctrl)
-
-                # after renaming dupe_grp
-                grp_leaf = dupe_grp.split("|")[-1]
-                jnt_name = grp_leaf.replace("_Ctrl_Grp", "_Jnt")
-
-                if cmds.objExists(jnt_name):
-                    cmds.matchTransform(dupe_grp, jnt_name, pos=True, rot=True)
-                else:
-                    cmds.warning("No matching joint for {}".format(grp_leaf))
-
-            #add newly renamed controls to the group
-            cmds.parent(dupe_ctrl, "mirror_group")
-
-    #mirror the control group -1 on the x-axis
-    cmds.scale(-1,1,1, mirror_grp, absolute=True)
-
-    #reparent the controls to their ctrl grps
-    reparent_controls_to_groups(unparented_ctrls)
-
-    #delete the now empty group
-    cmds.delete(mirror_grp)
-
-    #set translate x,y,z to 0
-    for ctrl in unparented_ctrls:
-        cmds.setAttr(ctrl + ".translate", 0,0,0)
-        #freeze all
-        cmds.makeIdentity(ctrl, apply=True, translate=True, rotate=True, scale=True, normal=True)
+                dupe_ctrl = rename(dupe_ctrl, new_leaf)
+                mirrored_ctrls.append(dupe_ctrl)
+
+        # reflect the LEFT joint's world matrix across the YZ plane and
+        # drop the duplicated group straight onto the result; negating
+        # row 0 of the rotation sub-matrix plus the X translation is the
+        # full X-mirror, equivalent to the old mirror-group scale dance.
+        jnt_name = parent.split("|")[-1].replace("_Ctrl_Grp", "_Jnt")
+        if objExists(jnt_name):
+            mat = getAttr(jnt_name + ".worldMatrix[0]")
+        else:
+            cmds.warning("No matching joint for {}, mirroring the group in place".format(parent))
+            mat = getAttr(parent + ".worldMatrix[0]")
+        mat[12] = -mat[12]
+        mat[1] = -mat[1]
+        mat[2] = -mat[2]
+        mat[4] = -mat[4]
+        mat[8] = -mat[8]
+        xform(dupe_grp, ws=True, m=mat)
+
+    #set translate x,y,z to 0 with one command per control,
+    #then freeze the whole batch at once -- makeIdentity takes a list
+    for ctrl in mirrored_ctrls:
+        xform(ctrl, os=True, t=(0, 0, 0))
+    if mirrored_ctrls:
+        cmds.makeIdentity(mirrored_ctrls, apply=True, translate=True, rotate=True, scale=True, normal=False)
 
 MirrorControls()
@@ -1,25 +1,38 @@
 import maya.cmds as cmds
 
-sels = cmds.ls(sl=True)
+def connect_broken_fk(sels=None):
+    # sels lets a multi-step tool pass a cached selection list instead of
+    # forcing another walk of the active selection
+    if sels is None:
+        sels = cmds.ls(sl=True)
 
-for index in range(0, len(sels) - 1, 1):
-    parent_ctrl = sels[index]
-    child_ctrl = sels[index + 1]
+    # one undo chunk for the whole setup instead of a record per command
+    cmds.undoInfo(openChunk=True)
+    try:
+        # adding custom attributes in a pre-pass so the constraint wiring
+        # below doesn't re-dirty each control attribute by attribute
+        child_ctrls = sels[1:]
+        for child_ctrl in child_ctrls:
+            cmds.addAttr(child_ctrl, ln="Follow_Translate", at="double", min=0, max=1, dv=1)
+            cmds.setAttr(f"{child_ctrl}.Follow_Translate", e=True, keyable=True)
+            cmds.addAttr(child_ctrl, ln="Follow_Rotate", at="double", min=0, max=1, dv=1)
+            cmds.setAttr(f"{child_ctrl}.Follow_Rotate", e=True, keyable=True)
 
-    child_ctrl_grp = cmds.listRelatives(child_ctrl, parent=True)[0]
+        for index in range(0, len(sels) - 1, 1):
+            parent_ctrl = sels[index]
+            child_ctrl = sels[index + 1]
 
-    # creating parent constraints with and without translate/rotate
-    p_constraint1 = cmds.parentConstraint(parent_ctrl, child_ctrl_grp, mo=True, skipRotate=['x', 'y', 'z'], weight=1)[0]
-    p_constraint2 = cmds.parentConstraint(parent_ctrl, child_ctrl_grp, mo=True, skipTranslate=['x', 'y', 'z'], weight=1)[0]
-    s_constraint = cmds.scaleConstraint(parent_ctrl, child_ctrl_grp, mo=True, weight=1)[0]  # constrain scale
+            child_ctrl_grp = cmds.listRelatives(child_ctrl, parent=True)[0]
 
-    # adding custom attributes
-    cmds.addAttr(child_ctrl, ln="Follow_Translate", at="double", min=0, max=1, dv=1)
-    cmds.setAttr(f"{child_ctrl}.Follow_Translate", e=True, keyable=True)
-    cmds.addAttr(child_ctrl, ln="Follow_Rotate", at="double", min=0, max=1, dv=1)
-    cmds.setAttr(f"{child_ctrl}.Follow_Rotate", e=True, keyable=True)
+            # creating parent constraints with and without translate/rotate
+            p_constraint1 = cmds.parentConstraint(parent_ctrl, child_ctrl_grp, mo=True, skipRotate=['x', 'y', 'z'], weight=1)[0]
+            p_constraint2 = cmds.parentConstraint(parent_ctrl, child_ctrl_grp, mo=True, skipTranslate=['x', 'y', 'z'], weight=1)[0]
+            s_constraint = cmds.scaleConstraint(parent_ctrl, child_ctrl_grp, mo=True, weight=1)[0]  # constrain scale
 
-    # connecting custom attributes to parent constraints
-    cmds.connectAttr(f"{child_ctrl}.Follow_Translate", f"{p_constraint1}.w0", f=True)
-    cmds.connectAttr(f"{child_ctrl}.Follow_Rotate", f"{p_constraint2}.w0", f=True)
-    cmds.connectAttr(f"{child_ctrl}.Follow_Rotate", f"{p_constraint2}.w0", f=True)
\ No newline at end of file
+            # connecting custom attributes to parent constraints
+            cmds.connectAttr(f"{child_ctrl}.Follow_Translate", f"{p_constraint1}.w0", f=True)
+            cmds.connectAttr(f"{child_ctrl}.Follow_Rotate", f"{p_constraint2}.w0", f=True)
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+connect_broken_fk()